@@ -10,3 +10,5 @@ router.include_router(players.router, prefix="/players", tags=["players"])
 router.include_router(positions.router, prefix="/positions", tags=["positions"])
 router.include_router(combinations.router, prefix="/combinations", tags=["combinations"])
 router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+
+__all__ = ["router"]
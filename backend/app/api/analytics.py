@@ -1,11 +1,14 @@
 """New analytics endpoints powered by DuckDB."""
 
 from fastapi import APIRouter, HTTPException, Query
+from pydantic import TypeAdapter
 import logging
 from typing import List
 
+from ..core.responses import ORJSONResponse
 from ..models.schemas import (
     HeatMapResponse,
+    HeatMapColumnsResponse,
     HeatMapCell,
     StackFinderResponse,
     StackEntry,
@@ -15,13 +18,18 @@ from ..models.schemas import (
 from ..services.analytics_service import analytics_service
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/analytics", tags=["analytics"])
+router = APIRouter()
+
+# Validate whole result sets in one call instead of one model per row
+_heat_map_cells = TypeAdapter(List[HeatMapCell])
+_stack_entries = TypeAdapter(List[StackEntry])
+_drift_entries = TypeAdapter(List[DriftEntry])
 
 
 @router.get("/heat-map", response_model=HeatMapResponse)
 async def get_heat_map():
     try:
-        cells = [HeatMapCell(**c) for c in analytics_service.get_heat_map()]
+        cells = _heat_map_cells.validate_python(analytics_service.get_heat_map())
         total = sum(c.count for c in cells)
         return HeatMapResponse(cells=cells, total_picks=total)
     except Exception as exc:
@@ -29,10 +37,27 @@ async def get_heat_map():
         raise HTTPException(status_code=500, detail="Failed to compute heat map")
 
 
+@router.get("/heat-map/columns", response_model=HeatMapColumnsResponse)
+async def get_heat_map_columns():
+    """Heat map in columnar form: three flat arrays instead of one object per cell."""
+    try:
+        cells = analytics_service.get_heat_map()
+        counts = [c["count"] for c in cells]
+        return ORJSONResponse({
+            "round": [c["round"] for c in cells],
+            "position": [c["position"] for c in cells],
+            "count": counts,
+            "total_picks": sum(counts),
+        })
+    except Exception as exc:
+        logger.exception("Heat map error: %s", exc)
+        raise HTTPException(status_code=500, detail="Failed to compute heat map")
+
+
 @router.get("/stacks", response_model=StackFinderResponse)
 async def get_stacks(n_rounds: int = Query(10, ge=1, le=20), limit: int = Query(100, ge=1, le=1000)):
     try:
-        stacks = [StackEntry(**row) for row in analytics_service.get_stacks(n_rounds, limit)]
+        stacks = _stack_entries.validate_python(analytics_service.get_stacks(n_rounds, limit))
         return StackFinderResponse(stacks=stacks, total_stacks=len(stacks))
     except Exception as exc:
         logger.exception("Stack finder error: %s", exc)
@@ -42,7 +67,7 @@ async def get_stacks(n_rounds: int = Query(10, ge=1, le=20), limit: int = Query(
 @router.get("/drift", response_model=DriftResponse)
 async def get_adp_drift(limit: int = Query(100, ge=1, le=1000)):
     try:
-        drifts = [DriftEntry(**d) for d in analytics_service.get_adp_drift()[:limit]]
+        drifts = _drift_entries.validate_python(analytics_service.get_adp_drift()[:limit])
         return DriftResponse(drifts=drifts)
     except Exception as exc:
         logger.exception("Drift error: %s", exc)
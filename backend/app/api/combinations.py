@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from typing import List
 import logging
 
+from ..core.responses import ORJSONResponse
+
 from ..models.schemas import CombinationsResponse, CombinationFilter, RosterConstructionResponse
 from ..services.data_service import data_service  # still used for roster construction
 from ..services.analytics_service import analytics_service
@@ -20,7 +22,7 @@ async def get_player_combinations(
     Find and return teams that have all of the `required_players` drafted within the first `n_rounds`.
     """
     try:
-        logger.info(f"Fetching player combinations for players: {required_players} within {n_rounds} rounds")
+        logger.info("Fetching player combinations for players: %s within %d rounds", required_players, n_rounds)
 
         filter_params = CombinationFilter(
             required_players=required_players,
@@ -28,20 +30,34 @@ async def get_player_combinations(
             limit=limit
         )
 
-        combinations_data = analytics_service.get_player_combinations(
+        combinations_data, total_combinations = analytics_service.get_player_combinations(
             required_players=required_players,
             n_rounds=n_rounds,
             limit=limit
         )
 
-        return CombinationsResponse(
-            combinations=combinations_data,
-            total_combinations=len(combinations_data),
-            filter_applied=filter_params
-        )
+        # Shape rows exactly like `TeamCombination` and serialise with orjson
+        # instead of validating one model per team.  The service rows are
+        # cached, so build new dicts rather than mutating them.
+        combinations = [
+            {
+                # Same coercion pydantic applies to the int field ("4_5" -> 45)
+                "team_id": int(c["team_id"]),
+                "draft_id": c["draft_id"],
+                "draft_position": c["draft_position"],
+                "players": c["players"],
+                "position_counts": c["position_counts"],
+            }
+            for c in combinations_data
+        ]
+        return ORJSONResponse({
+            "combinations": combinations,
+            "total_combinations": total_combinations,
+            "filter_applied": filter_params.model_dump()
+        })
 
     except Exception as e:
-        logger.exception(f"Error fetching player combinations: {e}")
+        logger.exception("Error fetching player combinations: %s", e)
         raise HTTPException(
             status_code=500,
             detail="An unexpected error occurred while fetching player combinations."
@@ -58,12 +74,13 @@ async def get_roster_construction():
 
         roster_data = data_service.get_roster_construction()
 
-        return RosterConstructionResponse(
-            roster_constructions=roster_data
+        return Response(
+            content=f'{{"roster_constructions":{roster_data.write_json()}}}',
+            media_type="application/json",
         )
 
     except Exception as e:
-        logger.exception(f"Error fetching roster construction data: {e}")
+        logger.exception("Error fetching roster construction data: %s", e)
         raise HTTPException(
             status_code=500,
             detail="An unexpected error occurred while fetching roster construction data."
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, HTTPException
+from functools import lru_cache
+
+from fastapi import APIRouter, HTTPException, Response
 import logging
 
 from ..models.schemas import MetadataResponse, ErrorResponse
@@ -8,22 +10,27 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
+def _metadata_json() -> bytes:
+    """Serialized metadata; the dataset is static, so it is encoded only once."""
+    metadata = data_service.get_metadata()
+    return MetadataResponse(
+        total_players=metadata["total_players"],
+        total_drafts=metadata["total_drafts"],
+        total_teams=metadata["total_teams"],
+        all_players=metadata["all_players"]
+    ).model_dump_json().encode()
+
+
 @router.get("/", response_model=MetadataResponse)
 async def get_metadata():
     """Get dataset metadata including player count, draft count, and all players."""
     try:
         logger.info("Fetching dataset metadata")
-        metadata = data_service.get_metadata()
-        
-        return MetadataResponse(
-            total_players=metadata["total_players"],
-            total_drafts=metadata["total_drafts"],
-            total_teams=metadata["total_teams"],
-            all_players=metadata["all_players"]
-        )
+        return Response(content=_metadata_json(), media_type="application/json")
     
     except Exception as e:
-        logger.error(f"Error fetching metadata: {str(e)}")
+        logger.error("Error fetching metadata: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch metadata: {str(e)}"
@@ -1,4 +1,5 @@
 from fastapi import APIRouter, HTTPException, Query
+from ..core.responses import ORJSONResponse
 from typing import List, Optional
 import logging
 
@@ -23,7 +24,7 @@ async def get_players(
 ):
     """Get players with optional filtering and pagination."""
     try:
-        logger.info(f"Fetching players with filters: positions={positions}, search_term={search_term}")
+        logger.info("Fetching players with filters: positions=%s, search_term=%s", positions, search_term)
         
         players, total_count = analytics_service.get_players(
             positions=positions,
@@ -45,14 +46,16 @@ async def get_players(
             total_pages=(total_count + limit - 1) // limit if limit > 0 else 1
         )
 
-        return PlayersResponse(
-            players=players,
-            page_info=page_info_obj,
-            total_count=total_count
-        )
+        # Rows are already shaped like `Player`; serialise them with orjson
+        # directly instead of validating and re-encoding each one.
+        return ORJSONResponse({
+            "players": players,
+            "page_info": page_info_obj.model_dump(),
+            "total_count": total_count
+        })
     
     except Exception as e:
-        logger.error(f"Error fetching players: {str(e)}")
+        logger.error("Error fetching players: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch players: {str(e)}"
@@ -66,7 +69,7 @@ async def search_players(
 ):
     """Search players by name."""
     try:
-        logger.info(f"Searching players with query: {q}")
+        logger.info("Searching players with query: %s", q)
         
         players, total_count = analytics_service.get_players(
             search_term=q,
@@ -74,14 +77,14 @@ async def search_players(
             offset=0
         )
         
-        return {
+        return ORJSONResponse({
             "query": q,
             "results": players,
             "total_found": total_count
-        }
+        })
     
     except Exception as e:
-        logger.error(f"Error searching players: {str(e)}")
+        logger.error("Error searching players: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to search players: {str(e)}"
@@ -96,13 +99,13 @@ async def get_player_details(
 ):
     """Get detailed draft data for a single player."""
     try:
-        logger.info(f"Fetching details for player: {player_name}, position: {position}, team: {team}")
+        logger.info("Fetching details for player: %s, position: %s, team: %s", player_name, position, team)
         details = data_service.get_player_details(player_name, position, team)
         if not details:
             raise HTTPException(status_code=404, detail="Player not found")
         return PlayerDetailsResponse(**details)
     except Exception as e:
-        logger.error(f"Error fetching player details: {str(e)}")
+        logger.error("Error fetching player details: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch player details: {str(e)}"
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 import logging
 from typing import List, Dict, Any
 
@@ -32,7 +32,7 @@ async def get_position_stats():
         )
     
     except Exception as e:
-        logger.error(f"Error fetching position stats: {str(e)}")
+        logger.error("Error fetching position stats: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch position statistics: {str(e)}"
@@ -44,9 +44,9 @@ async def get_first_player_position_stats():
     try:
         logger.info("Fetching first player draft stats by position")
         stats = data_service.get_first_player_draft_stats()
-        return stats
+        return Response(content=stats.write_json(), media_type="application/json")
     except Exception as e:
-        logger.error(f"Error fetching first player draft stats: {str(e)}")
+        logger.error("Error fetching first player draft stats: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch first player draft stats: {str(e)}"
@@ -56,14 +56,14 @@ async def get_first_player_position_stats():
 async def get_position_draft_counts_by_round(position: Position, aggregation: AggregationType = AggregationType.MEAN):
     """Get draft counts per round for a specific position."""
     try:
-        logger.info(f"Fetching draft counts by round for position: {position.value}")
+        logger.info("Fetching draft counts by round for position: %s", position.value)
         round_counts = data_service.get_position_draft_counts_by_round(position, aggregation)
         return PositionRoundCountsResponse(
             position=position,
             round_counts=round_counts
         )
     except Exception as e:
-        logger.error(f"Error fetching position draft counts by round for {position.value}: {str(e)}")
+        logger.error("Error fetching position draft counts by round for %s: %s", position.value, e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to fetch position draft counts by round: {str(e)}"
@@ -75,9 +75,9 @@ async def get_roster_construction():
     try:
         logger.info("Fetching roster construction data")
         constructions = data_service.get_roster_construction()
-        return constructions
+        return Response(content=constructions.write_json(), media_type="application/json")
     except Exception as e:
-        logger.error(f"Error fetching roster construction data: {e}")
+        logger.error("Error fetching roster construction data: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
 
 
@@ -87,7 +87,7 @@ async def get_roster_construction_counts():
     try:
         logger.info("Fetching aggregated roster construction counts")
         counts = data_service.get_roster_construction_counts()
-        return counts
+        return Response(content=counts.write_json(), media_type="application/json")
     except Exception as e:
-        logger.error(f"Error fetching roster construction counts: {e}")
+        logger.error("Error fetching roster construction counts: %s", e)
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -0,0 +1,18 @@
+from typing import Any
+
+import orjson
+from fastapi.responses import Response
+
+
+class ORJSONResponse(Response):
+    """JSON response rendered with orjson.
+
+    Returning this from a route bypasses FastAPI's response-model validation
+    and ``jsonable_encoder`` walk, so it is meant for payloads that are already
+    plain dicts/lists shaped like the declared response model.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
@@ -1,18 +1,16 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 from fastapi.middleware.cors import CORSMiddleware
 import logging
-import polars as pl
 
 from .api import router
 from .models.schemas import (
     Position, PlayerFilter, CombinationFilter, SortableColumn, SortOrder, AggregationType
 )
-
-# Enable Polars string cache for categorical comparisons
-pl.enable_string_cache()
 from .core.config import settings
+from .services.analytics_service import analytics_service
 
 # Configure logging
 logging.basicConfig(
@@ -22,13 +20,28 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Pre-aggregate the parameterless analytics and pick query backends before serving requests."""
+    # Both are memoised, so every later request is served from memory
+    analytics_service.get_heat_map()
+    analytics_service.get_adp_drift()
+    logger.info("Pre-aggregated heat map and ADP drift")
+    # Time DuckDB against Polars on warm, representative queries now rather
+    # than on the first live request of each shape
+    analytics_service.calibrate_backends()
+    yield
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Fantasy Draft Analytics API",
     description="RESTful API for fantasy football draft analysis and player combinations",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -173,6 +173,14 @@ class HeatMapResponse(BaseModel):
     total_picks: int
 
 
+class HeatMapColumnsResponse(BaseModel):
+    """Heat map as parallel arrays; index i of each list describes one cell."""
+    round: List[int]
+    position: List[Position]
+    count: List[int]
+    total_picks: int
+
+
 class StackEntry(BaseModel):
     draft_id: int
     team_id: int
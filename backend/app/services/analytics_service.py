@@ -1,24 +1,212 @@
 """Analytics service that leverages DuckDB for heavy SQL queries.
 
 The goal is to off-load complex group-by / filtering operations to DuckDB and
-then perform final small aggregations in Polars so the existing Pydantic
-schemas remain unchanged.
+return rows already shaped like the existing Pydantic schemas.
 """
 
 from __future__ import annotations
 
 import logging
 import time
-from typing import Any, List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, List, Dict, Optional, Tuple
 
 import polars as pl
 
 from .duckdb_service import duckdb_service
 from .data_service import data_service  # Polars fallback
-from ..models.schemas import Player, Position, SortableColumn, SortOrder
+from ..models.schemas import Position, SortableColumn, SortOrder
 
 logger = logging.getLogger(__name__)
 
+# Winning backend per query shape, decided by `calibrate_backends` at startup
+# so requests run only one engine instead of racing both.
+_BACKEND_CHOICE: Dict[Tuple[Any, ...], str] = {}
+
+# Timed runs per backend and query shape during calibration, after one warm-up
+_CALIBRATION_REPEATS = 5
+
+# SQL expression for each sortable column of the players listing
+_PLAYER_SORT_SQL: Dict[SortableColumn, str] = {
+    SortableColumn.NAME: "player",
+    SortableColumn.POSITION: "Position",
+    SortableColumn.TEAM: "Team",
+    SortableColumn.DRAFT_PERCENTAGE: "draft_percentage",
+    SortableColumn.AVG_PICK: "avg_pick",
+    SortableColumn.AVG_ROUND: "AVG(round)",
+}
+
+# ----------------------------------------------------------------------
+# SQL statements, compiled once at import rather than rebuilt per call
+# ----------------------------------------------------------------------
+# Players aggregation; `{where}` is filled with bound-parameter predicates only
+_PLAYERS_SQL = """
+SELECT
+    player         AS name,
+    Position       AS position,
+    Team           AS team,
+    AVG(pick)      AS avg_pick,
+    MIN(pick)      AS min_pick,
+    MAX(pick)      AS max_pick,
+    COUNT(*) * 100.0 / ? AS draft_percentage,
+    -- Windows run after GROUP BY, so this is the number of players
+    -- matching the filter before LIMIT/OFFSET are applied
+    COUNT(*) OVER () AS total_count
+FROM picks
+{where}
+GROUP BY player, Position, Team
+"""
+
+_COMBINATIONS_SQL = """
+WITH filtered AS (
+    SELECT draft,
+           team_id,
+           player,
+           Position,
+           round,
+           draft_position
+    FROM picks
+    WHERE round <= $n_rounds
+), target_teams AS (
+    SELECT team_id,
+           ANY_VALUE(draft)          AS draft_id,
+           ANY_VALUE(draft_position) AS draft_position
+    FROM filtered
+    WHERE list_contains($players, player)
+    GROUP BY team_id
+    -- One bit per required player: OR-ing 8-byte masks is cheaper
+    -- than keeping a distinct-player hash set per team
+    HAVING bit_or(1::UBIGINT << (list_position($players, player) - 1)) = $full_mask
+), page AS (
+    -- Pick the requested page first so rosters are only built for it
+    SELECT *, COUNT(*) OVER () AS total_teams
+    FROM target_teams
+    ORDER BY draft_id, draft_position
+    LIMIT $limit
+), rosters AS (
+    SELECT team_id, f.player, f.Position, f.round
+    FROM page
+    JOIN filtered f USING (team_id)
+), position_counts AS (
+    -- "QB: 1, RB: 2, WR: 3" per team, positions in alphabetical order
+    SELECT team_id,
+           string_agg(Position || ': ' || c, ', ' ORDER BY Position) AS position_counts
+    FROM (
+        SELECT team_id, Position, COUNT(*) AS c
+        FROM rosters
+        GROUP BY team_id, Position
+    )
+    GROUP BY team_id
+)
+SELECT team_id,
+       p.draft_id,
+       p.draft_position,
+       list(r.player ORDER BY r.round)   AS players,
+       list(r.Position ORDER BY r.round) AS positions,
+       ANY_VALUE(pc.position_counts)     AS position_counts,
+       ANY_VALUE(p.total_teams)          AS total_teams
+FROM page p
+JOIN rosters r USING (team_id)
+JOIN position_counts pc USING (team_id)
+GROUP BY team_id, p.draft_id, p.draft_position
+ORDER BY p.draft_id, p.draft_position;
+"""
+
+_HEAT_MAP_SQL = """
+SELECT round, Position AS position, COUNT(*) AS count
+FROM picks
+GROUP BY round, Position
+ORDER BY round, Position;
+"""
+
+_STACKS_SQL = """
+WITH early AS (
+    SELECT draft, team_id, player, Position, Team AS nfl_team, round
+    FROM picks
+    WHERE round <= $n_rounds
+),
+qbs AS (
+    SELECT draft, team_id, player AS qb, nfl_team, round AS round_qb
+    FROM early
+    WHERE Position = 'QB'
+),
+wrte AS (
+    SELECT draft, team_id, player AS receiver, nfl_team, round AS round_receiver
+    FROM early
+    WHERE Position IN ('WR', 'TE')
+),
+combos AS (
+    SELECT q.draft, q.team_id, q.nfl_team, q.qb, w.receiver, q.round_qb, w.round_receiver
+    FROM qbs q
+    JOIN wrte w
+      ON q.draft = w.draft AND q.team_id = w.team_id AND q.nfl_team = w.nfl_team
+)
+SELECT draft AS draft_id, team_id, nfl_team, qb, receiver, round_qb, round_receiver
+FROM combos
+ORDER BY draft, team_id
+LIMIT $limit;
+"""
+
+_ADP_DRIFT_SQL = """
+SELECT *, avg_pick_late - avg_pick_early AS drift
+FROM (
+    SELECT player   AS name,
+           Position AS position,
+           AVG(pick) FILTER (WHERE draft <= $mid) AS avg_pick_early,
+           AVG(pick) FILTER (WHERE draft >  $mid) AS avg_pick_late
+    FROM picks
+    GROUP BY player, Position
+)
+WHERE avg_pick_early IS NOT NULL AND avg_pick_late IS NOT NULL
+ORDER BY drift DESC;
+"""
+
+
+def _run_fastest(
+    key: Tuple[Any, ...],
+    run_duckdb: Callable[[], Any],
+    run_polars: Callable[[], Any],
+) -> Any:
+    """Return the result of the calibrated backend for `key`.
+
+    Polars is the default, both here for shapes that were not calibrated
+    (e.g. when the app runs without its lifespan) and in `_calibrate`; a
+    live request never pays for timing both backends.
+    """
+    if _BACKEND_CHOICE.get(key) == "duckdb":
+        return run_duckdb()
+    return run_polars()
+
+
+def _median_duration(run: Callable[[], Any]) -> float:
+    """Median wall time of `run` over `_CALIBRATION_REPEATS` calls after a warm-up."""
+    run()
+    durations = []
+    for _ in range(_CALIBRATION_REPEATS):
+        t0 = time.perf_counter()
+        run()
+        durations.append(time.perf_counter() - t0)
+    return sorted(durations)[len(durations) // 2]
+
+
+def _calibrate(
+    key: Tuple[Any, ...],
+    run_duckdb: Callable[[], Any],
+    run_polars: Callable[[], Any],
+) -> None:
+    """Time both backends for one query shape and record the winner.
+
+    Polars, the default, is kept unless DuckDB is >20 % faster.
+    """
+    dur_duck = _median_duration(run_duckdb)
+    dur_pol = _median_duration(run_polars)
+    choice = "duckdb" if dur_duck < dur_pol * 0.8 else "polars"
+    _BACKEND_CHOICE[key] = choice
+    logger.info(
+        "Calibrated %s: DuckDB %.2f ms, Polars %.2f ms -> %s",
+        key, dur_duck * 1e3, dur_pol * 1e3, choice,
+    )
+
 
 class AnalyticsService:  # pylint: disable=too-few-public-methods
     """Wrapper around DuckDB heavy queries."""
@@ -34,95 +222,111 @@ class AnalyticsService:  # pylint: disable=too-few-public-methods
         offset: int = 0,
         sort_by: SortableColumn = SortableColumn.AVG_PICK,
         sort_order: SortOrder = SortOrder.ASC,
-    ) -> Tuple[List[Player], int]:
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """Return a paginated list of players with aggregated draft statistics.
 
-        This implementation runs the heavy aggregation in DuckDB and returns
-        Pydantic `Player` models so the existing API schema remains unchanged.
+        Both implementations return plain dicts keyed by the `Player` schema
+        fields, ready to be serialised without building one Pydantic model
+        per row. Polars runs the query unless calibration found DuckDB's
+        aggregation faster for this filter combination.
+        Results are memoised per distinct set of arguments; the underlying
+        data is read-only for the life of the process.
         """
+        positions_key = tuple(sorted(set(positions))) if positions else None
+        return AnalyticsService._cached_players(
+            positions_key, search_term, limit, offset, sort_by, sort_order
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _cached_players(
+        positions: Optional[Tuple[Position, ...]],
+        search_term: Optional[str],
+        limit: int,
+        offset: int,
+        sort_by: SortableColumn,
+        sort_order: SortOrder,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Memoised body of `get_players`; callers must not mutate the result."""
+        positions_list = list(positions) if positions else None
+        return _run_fastest(
+            ("players", bool(positions), bool(search_term)),
+            lambda: AnalyticsService._duckdb_players(
+                positions_list, search_term, limit, offset, sort_by, sort_order
+            ),
+            lambda: data_service.get_players(
+                positions=positions_list,
+                search_term=search_term,
+                limit=limit,
+                offset=offset,
+                sort_by=sort_by,
+                sort_order=sort_order,
+            ),
+        )
+
+    @staticmethod
+    def _duckdb_players(
+        positions: Optional[List[Position]],
+        search_term: Optional[str],
+        limit: int,
+        offset: int,
+        sort_by: SortableColumn,
+        sort_order: SortOrder,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """DuckDB implementation of `get_players`."""
         # --------------------------------------------------------------
-        # Pre-compute total drafts for draft_percentage calculation.
+        # Total drafts for draft_percentage is computed once at startup by
+        # DataService; re-counting distinct drafts here would scan the whole
+        # `draft` column on every request.
         # --------------------------------------------------------------
-        total_drafts_df = duckdb_service.query(
-            "SELECT COUNT(DISTINCT draft) AS n FROM picks LIMIT 1;"
-        )
-        total_drafts: int = int(total_drafts_df.item()) if not total_drafts_df.is_empty() else 1
+        total_drafts: int = data_service.get_metadata().get("total_drafts") or 1
 
         # --------------------------------------------------------------
-        # Build dynamic WHERE clause based on optional filters.
+        # Build dynamic WHERE clause based on optional filters.  Values are
+        # bound as parameters, never interpolated into the SQL text.
         # --------------------------------------------------------------
         where_clauses: List[str] = []
+        params: List[Any] = [total_drafts]
 
         if positions:
-            pos_sql = ", ".join([f"'{p.value}'" for p in positions])
-            where_clauses.append(f"Position IN ({pos_sql})")
+            where_clauses.append("list_contains(?, Position)")
+            params.append([p.value for p in positions])
 
         if search_term:
-            sanitized = search_term.lower().replace("'", "''")
-            where_clauses.append(f"lower(player) LIKE '%{sanitized}%'")
+            # Same normalisation as the Polars player index: case, dots and
+            # apostrophes are ignored on both sides.
+            where_clauses.append(
+                "contains(replace(replace(lower(player), '.', ''), '''', ''), ?)"
+            )
+            params.append(search_term.lower().replace('.', '').replace("'", ''))
 
         where_sql = f"WHERE {' AND '.join(where_clauses)}" if where_clauses else ""
 
-        # --------------------------------------------------------------
-        # Base aggregation SQL.
-        # --------------------------------------------------------------
-        base_sql = f"""
-        SELECT
-            player,
-            Position,
-            Team,
-            AVG(pick)      AS avg_pick,
-            MIN(pick)      AS min_pick,
-            MAX(pick)      AS max_pick,
-            COUNT(*) * 100.0 / {total_drafts} AS draft_percentage
-        FROM picks
-        {where_sql}
-        GROUP BY player, Position, Team
-        """
-
-        # Total count BEFORE pagination
-        total_count_df = duckdb_service.query(f"SELECT COUNT(*) AS cnt FROM ({base_sql})")
-        total_count: int = int(total_count_df['cnt'][0]) if not total_count_df.is_empty() else 0
+        base_sql = _PLAYERS_SQL.format(where=where_sql)
 
-        # Apply order, pagination
+        # Apply order, pagination.  ORDER BY cannot be bound, so the column
+        # comes from a fixed whitelist keyed by the validated enum.
         order_dir = 'DESC' if sort_order == SortOrder.DESC else 'ASC'
         final_sql = (
             f"{base_sql}\n"
-            f"ORDER BY {sort_by.value} {order_dir}\n"
-            f"LIMIT {limit} OFFSET {offset}"
+            f"ORDER BY {_PLAYER_SORT_SQL[sort_by]} {order_dir}\n"
+            "LIMIT ? OFFSET ?"
         )
 
         logger.info("Running DuckDB players query: limit=%d offset=%d", limit, offset)
-        t0 = time.perf_counter()
-        df: pl.DataFrame = duckdb_service.query(final_sql)
-        dur_duck = time.perf_counter() - t0
-
-        if df.is_empty():
-            return [], total_count
-
-        # Optionally benchmark Polars path if DuckDB slower than 50 ms
-        players: List[Player]
-        if dur_duck > 0.05:  # 50 ms threshold to consider fallback check
-            t1 = time.perf_counter()
-            pol_players, pol_total = data_service.get_players(
-                positions=positions,
-                search_term=search_term,
-                limit=limit,
-                offset=offset,
-                sort_by=sort_by,
-                sort_order=sort_order,
-            )
-            dur_pol = time.perf_counter() - t1
-            if dur_pol < dur_duck * 0.8:  # >20 % faster
-                logger.info(
-                    "Polars faster (%.2f ms) than DuckDB (%.2f ms); using fallback", dur_pol * 1e3, dur_duck * 1e3
-                )
-                return pol_players, pol_total
+        rows = duckdb_service.query_dicts(final_sql, [*params, limit, offset])
 
-        # Default: use DuckDB result
-        df = df.rename({"player": "name", "Position": "position", "Team": "team"})
-        players = [Player(**row) for row in df.to_dicts()]
-        return players, total_count
+        if not rows:
+            # An empty page carries no window count; only an offset past the
+            # end needs the total counted separately.
+            if offset == 0:
+                return [], 0
+            return [], duckdb_service.query_scalar(f"SELECT COUNT(*) FROM ({base_sql})", params)
+
+        total_count = rows[0]["total_count"]
+        for row in rows:
+            del row["total_count"]
+        return rows, total_count
 
     # ------------------------------------------------------------------
     # Player Combinations
@@ -132,202 +336,179 @@ class AnalyticsService:  # pylint: disable=too-few-public-methods
         required_players: List[str],
         n_rounds: int = 20,
         limit: int = 100,
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """Return teams that drafted *all* `required_players` within first `n_rounds`.
 
-        The heavy filtering of candidate teams is done in DuckDB; the final
-        reshape to match the existing schema is finished with Polars.
+        Filtering, the per-team roster aggregation and the position-count
+        formatting run in Polars, or in DuckDB when calibration found it
+        faster for this number of players.
+        Results are memoised on the order-independent set of players, so
+        repeat lookups are served without running either engine.
+
+        Returns the first `limit` teams together with the total number of
+        teams meeting the criteria, computed in the same query.
         """
         if not required_players:
-            return []
+            return [], 0
 
-        # Sanitize and build SQL IN list
-        # Escape single quotes by doubling them (SQL standard)
-        sanitized_players = [p.replace("'", "''") for p in required_players]
-        players_sql_list = ", ".join([f"'{p}'" for p in sanitized_players])
-        num_required = len(required_players)
+        players_key = tuple(sorted(set(required_players)))
+        if len(players_key) > n_rounds:
+            # A team makes one pick per round, so it cannot hold them all
+            return [], 0
 
-        sql = f"""
-        WITH filtered AS (
-            SELECT draft,
-                   team_id,
-                   player,
-                   Position,
-                   round,
-                   draft_position
-            FROM picks
-            WHERE round <= {n_rounds}
-        ), target_teams AS (
-            SELECT team_id
-            FROM filtered
-            WHERE player IN ({players_sql_list})
-            GROUP BY team_id
-            HAVING COUNT(DISTINCT player) = {num_required}
+        if not data_service.has_players(players_key):
+            # A name outside the dataset (typo, stale client) matches no team
+            return [], 0
+
+        return AnalyticsService._cached_player_combinations(players_key, n_rounds, limit)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _cached_player_combinations(
+        players_key: Tuple[str, ...],
+        n_rounds: int,
+        limit: int,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Memoised body of `get_player_combinations`; callers must not mutate the result."""
+        required_players = list(players_key)
+        return _run_fastest(
+            ("combinations", len(required_players) > 1),
+            lambda: AnalyticsService._duckdb_player_combinations(required_players, n_rounds, limit),
+            lambda: data_service.get_player_combinations(
+                required_players=required_players,
+                n_rounds=n_rounds,
+                limit=limit,
+            ),
         )
-        SELECT *
-        FROM filtered
-        WHERE team_id IN (SELECT team_id FROM target_teams)
-        ORDER BY draft, draft_position, team_id, round;
-        """
+
+    @staticmethod
+    def _duckdb_player_combinations(
+        required_players: List[str],
+        n_rounds: int,
+        limit: int,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """DuckDB implementation of `get_player_combinations`."""
+        num_required = len(required_players)
 
         logger.info(
             "Running DuckDB combination query for %d required players (<= round %d)",
             num_required,
             n_rounds,
         )
-        t0 = time.perf_counter()
-        df: pl.DataFrame = duckdb_service.query(sql)
-        dur_duck = time.perf_counter() - t0
+        rows = duckdb_service.query_dicts(
+            _COMBINATIONS_SQL,
+            {
+                "n_rounds": n_rounds,
+                "players": required_players,
+                "full_mask": (1 << num_required) - 1,
+                "limit": limit,
+            },
+        )
 
-        if df.is_empty():
-            return []
+        if not rows:
+            return [], 0
 
-        # Optionally benchmark Polars path if DuckDB slower than 50 ms
-        result: List[Dict[str, Any]]
-        if dur_duck > 0.05:  # 50 ms threshold to consider fallback check
-            t1 = time.perf_counter()
-            pol_result = data_service.get_player_combinations(
-                required_players=required_players,
-                n_rounds=n_rounds,
-                limit=limit,
-            )
-            dur_pol = time.perf_counter() - t1
-            if dur_pol < dur_duck * 0.8:  # >20 % faster
-                logger.info(
-                    "Polars faster (%.2f ms) than DuckDB (%.2f ms); using fallback", dur_pol * 1e3, dur_duck * 1e3
-                )
-                return pol_result
-
-        # Default: use DuckDB result
-        # Aggregate per team using Polars (cheap at this stage)
-        result_df = (
-            df.lazy()
-            .group_by("team_id")
-            .agg(
-                pl.col("player").alias("players"),
-                pl.col("Position").alias("positions"),
-                pl.col("draft").first().alias("draft_id"),
-                pl.col("draft_position").first(),
-            )
-            .collect()
-            .sort(["draft_id", "draft_position"])  # deterministic order
-            .head(limit)
-        )
+        # Already paged, aggregated, formatted and ordered per team
+        total_teams = rows[0]["total_teams"]
+        for row in rows:
+            del row["total_teams"]
 
-        if result_df.is_empty():
-            return []
-
-        # Calculate position counts → string representation "QB:2, RB:5"
-        position_counts_df = (
-            result_df.lazy()
-            .select(["team_id", "positions"])
-            .explode("positions")
-            .group_by(["team_id", "positions"])
-            .agg(pl.len().alias("count"))
-            .collect()
-            .pivot(index="team_id", columns="positions", values="count")
-            .fill_null(0)
-        )
+        logger.info("DuckDB combination query returned %d teams", len(rows))
+        return rows, total_teams
 
-        if not position_counts_df.is_empty():
-            pos_cols = [c for c in position_counts_df.columns if c != "team_id"]
-            position_counts_str_df = (
-                position_counts_df.lazy()
-                .with_columns(
-                    pl.concat_str(
-                        [pl.format("{}: {}", pl.lit(c), pl.col(c)) for c in pos_cols],
-                        separator=", ",
-                    ).alias("position_counts")
-                )
-                .select(["team_id", "position_counts"])
-                .collect()
-            )
-            final_df = result_df.join(position_counts_str_df, on="team_id", how="left")
-        else:
-            final_df = result_df.with_columns(pl.lit(None, dtype=pl.String).alias("position_counts"))
 
-        logger.info("DuckDB combination query returned %d teams", final_df.height)
-        return final_df.to_dicts()
+    # ------------------------------------------------------------------
+    # Backend calibration
+    # ------------------------------------------------------------------
+    @staticmethod
+    def calibrate_backends() -> None:
+        """Choose DuckDB or Polars for each players / combinations query shape.
+
+        Meant to run once at startup, before requests are served. Inputs are
+        drawn from the loaded data: the most-drafted early-round players for
+        combinations, and a position filter plus a surname for the players
+        listing. Both backends are called directly, bypassing the result caches.
+        """
+        n_rounds = 6
+        df = data_service.get_dataframe()
+        top_players = (
+            df.filter(pl.col("round") <= n_rounds)
+            .get_column("player")
+            .cast(pl.String)
+            .value_counts(sort=True)
+            .get_column("player")
+            .head(2)
+            .to_list()
+        )
+        if not top_players:
+            return
+        search_term = top_players[0].split()[-1].lower()
+        sort_by, sort_order = SortableColumn.AVG_PICK, SortOrder.ASC
+
+        for positions in (None, [Position.RB]):
+            for term in (None, search_term):
+                _calibrate(
+                    ("players", bool(positions), bool(term)),
+                    lambda: AnalyticsService._duckdb_players(
+                        positions, term, 100, 0, sort_by, sort_order
+                    ),
+                    lambda: data_service.get_players(
+                        positions=positions,
+                        search_term=term,
+                        limit=100,
+                        offset=0,
+                        sort_by=sort_by,
+                        sort_order=sort_order,
+                    ),
+                )
 
+        for required_players in (top_players[:1], top_players):
+            _calibrate(
+                ("combinations", len(required_players) > 1),
+                lambda: AnalyticsService._duckdb_player_combinations(
+                    required_players, n_rounds, 100
+                ),
+                lambda: data_service.get_player_combinations(
+                    required_players=required_players,
+                    n_rounds=n_rounds,
+                    limit=100,
+                ),
+            )
 
     # ------------------------------------------------------------------
     # Heat Map (draft round x position counts)
     # ------------------------------------------------------------------
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_heat_map() -> List[Dict[str, Any]]:
         """Return pick counts grouped by round & position for heat-map visual.
+
+        The result never changes for a loaded dataset, so it is computed once.
         """
-        sql = """
-        SELECT round, Position, COUNT(*) AS count
-        FROM picks
-        GROUP BY round, Position
-        ORDER BY round, Position;
-        """
-        df = duckdb_service.query(sql)
-        return df.to_dicts()
+        return duckdb_service.query_dicts(_HEAT_MAP_SQL)
 
     # ------------------------------------------------------------------
     # Stack Finder (QB + WR/TE same NFL team drafted by same fantasy team)
     # ------------------------------------------------------------------
     @staticmethod
+    @lru_cache(maxsize=64)
     def get_stacks(n_rounds: int = 10, limit: int = 100) -> List[Dict[str, Any]]:
-        """Find basic QB/receiver stacks drafted within first `n_rounds`."""
-        sql = f"""
-        WITH early AS (
-            SELECT draft, team_id, player, Position, Team AS nfl_team, round
-            FROM picks
-            WHERE round <= {n_rounds}
-        ),
-        qbs AS (
-            SELECT draft, team_id, player AS qb, nfl_team, round AS round_qb
-            FROM early
-            WHERE Position = 'QB'
-        ),
-        wrte AS (
-            SELECT draft, team_id, player AS receiver, nfl_team, round AS round_receiver
-            FROM early
-            WHERE Position IN ('WR', 'TE')
-        ),
-        combos AS (
-            SELECT q.draft, q.team_id, q.nfl_team, q.qb, w.receiver, q.round_qb, w.round_receiver
-            FROM qbs q
-            JOIN wrte w
-              ON q.draft = w.draft AND q.team_id = w.team_id AND q.nfl_team = w.nfl_team
-        )
-        SELECT *
-        FROM combos
-        ORDER BY draft, team_id
-        LIMIT {limit};
-        """
-        return duckdb_service.query(sql).to_dicts()
+        """Find basic QB/receiver stacks drafted within first `n_rounds` (memoised)."""
+        return duckdb_service.query_dicts(_STACKS_SQL, {"n_rounds": n_rounds, "limit": limit})
 
     # ------------------------------------------------------------------
     # ADP Drift (compare first half vs second half drafts)
     # ------------------------------------------------------------------
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_adp_drift() -> List[Dict[str, Any]]:
-        """Calculate average pick drift between early vs late halves of drafts."""
-        # Determine midpoint draft id
-        midpoint_df = duckdb_service.query("""SELECT median(draft) AS mid FROM picks""")
-        mid = int(midpoint_df["mid"][0])
-
-        sql_template = """
-        SELECT player, Position, AVG(pick) AS avg_pick
-        FROM picks
-        WHERE draft {cond}
-        GROUP BY player, Position
-        """
-        early_df = duckdb_service.query(sql_template.format(cond=f"<= {mid}") )
-        late_df = duckdb_service.query(sql_template.format(cond=f"> {mid}") )
-
-        # Join on player/position
-        merged = (
-            early_df.rename({"avg_pick": "avg_pick_early"})
-            .join(late_df.rename({"avg_pick": "avg_pick_late"}), on=["player", "Position"], how="inner")
-            .with_columns((pl.col("avg_pick_late") - pl.col("avg_pick_early")).alias("drift"))
-            .sort("drift", descending=True)
-        )
-        return merged.to_dicts()
+        """Calculate average pick drift between early vs late halves of drafts (memoised)."""
+        # Determine midpoint draft id; ids are integers, so flooring keeps
+        # the `<=` split identical while comparing INTEGER to INTEGER
+        mid = int(duckdb_service.query_scalar("SELECT median(draft) FROM picks"))
+
+        # Both halves in one scan via filtered aggregates, no join needed
+        return duckdb_service.query_dicts(_ADP_DRIFT_SQL, {"mid": mid})
 
 # Global singleton
 analytics_service = AnalyticsService()
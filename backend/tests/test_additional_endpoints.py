@@ -25,3 +25,25 @@ def test_position_stats_endpoint():
     payload = resp.json()
     assert "position_stats" in payload and "total_picks" in payload
     assert len(payload["position_stats"]) > 0
+
+
+def test_analytics_endpoints():
+    for path in ("heat-map", "stacks", "drift"):
+        resp = client.get(f"/api/analytics/{path}")
+        assert resp.status_code == 200, path
+
+    cells = client.get("/api/analytics/heat-map").json()["cells"]
+    assert len(cells) > 0
+    assert {"round", "position", "count"} == set(cells[0].keys())
+
+
+def test_heat_map_columns_matches_cells():
+    cells = client.get("/api/analytics/heat-map").json()
+    resp = client.get("/api/analytics/heat-map/columns")
+    assert resp.status_code == 200
+    columns = resp.json()
+    assert columns["total_picks"] == cells["total_picks"]
+    assert [
+        {"round": r, "position": p, "count": c}
+        for r, p, c in zip(columns["round"], columns["position"], columns["count"])
+    ] == cells["cells"]
@@ -0,0 +1,102 @@
+"""DuckDB and Polars implementations of the players / combinations queries agree.
+
+Requests only reach the DuckDB SQL when startup calibration picks it, so these
+tests call both backends directly instead of going through the API.
+"""
+
+from typing import Any, Dict, List
+
+import pytest
+
+from backend.app.models.schemas import Position, SortableColumn, SortOrder
+from backend.app.services.analytics_service import AnalyticsService
+from backend.app.services.data_service import data_service
+
+
+def _comparable(rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Rows in a deterministic order, with float columns compared approximately.
+
+    The engines order tied sort keys differently and may differ in the last
+    bit of an average.
+    """
+    return [
+        {
+            **row,
+            "avg_pick": pytest.approx(row["avg_pick"]),
+            "draft_percentage": pytest.approx(row["draft_percentage"]),
+        }
+        for row in sorted(rows, key=lambda r: (r["name"], r["position"], r["team"]))
+    ]
+
+
+@pytest.mark.parametrize(
+    ("positions", "search_term"),
+    [
+        (None, None),
+        ([Position.RB], None),
+        (None, "brown"),
+        ([Position.WR, Position.TE], "a"),
+    ],
+)
+def test_players_backends_agree(positions, search_term):
+    duck_rows, duck_total = AnalyticsService._duckdb_players(
+        positions, search_term, 1000, 0, SortableColumn.AVG_PICK, SortOrder.ASC
+    )
+    pol_rows, pol_total = data_service.get_players(
+        positions=positions, search_term=search_term, limit=1000, offset=0
+    )
+    assert duck_total == pol_total > 0
+    assert len(duck_rows) == duck_total
+    assert _comparable(duck_rows) == _comparable(pol_rows)
+
+
+def test_players_backends_agree_on_page():
+    """A page sorted on a unique-ish key holds the same players in the same order."""
+    duck_rows, duck_total = AnalyticsService._duckdb_players(
+        None, None, 25, 50, SortableColumn.NAME, SortOrder.DESC
+    )
+    pol_rows, pol_total = data_service.get_players(
+        limit=25, offset=50, sort_by=SortableColumn.NAME, sort_order=SortOrder.DESC
+    )
+    assert duck_total == pol_total
+    assert [r["name"] for r in duck_rows] == [r["name"] for r in pol_rows]
+    assert _comparable(duck_rows) == _comparable(pol_rows)
+
+
+def test_players_offset_past_end():
+    """An empty page still reports the full number of matching players."""
+    duck_rows, duck_total = AnalyticsService._duckdb_players(
+        None, None, 50, 100_000, SortableColumn.AVG_PICK, SortOrder.ASC
+    )
+    pol_rows, pol_total = data_service.get_players(limit=50, offset=100_000)
+    assert duck_rows == pol_rows == []
+    assert duck_total == pol_total > 0
+
+
+@pytest.mark.parametrize(
+    "required_players",
+    [
+        ["A.J. Brown"],
+        ["A.J. Brown", "Jalen Hurts"],
+        ["Josh Allen", "Lamar Jackson"],
+    ],
+)
+def test_combinations_backends_agree(required_players):
+    duck_rows, duck_total = AnalyticsService._duckdb_player_combinations(
+        required_players, 6, 50
+    )
+    pol_rows, pol_total = data_service.get_player_combinations(
+        required_players=required_players, n_rounds=6, limit=50
+    )
+    assert duck_total == pol_total > 0
+    # Both page teams in (draft, team) order, and format position counts alike
+    assert duck_rows == pol_rows
+
+
+def test_combinations_no_match():
+    """A required player nobody drafted matches no team in either backend."""
+    required_players = ["A.J. Brown", "Not A Player"]
+    assert AnalyticsService._duckdb_player_combinations(required_players, 6, 50) == ([], 0)
+    assert data_service.get_player_combinations(
+        required_players=required_players, n_rounds=6, limit=50
+    ) == ([], 0)
@@ -10,6 +10,8 @@ import pytest
 from starlette.testclient import TestClient
 
 from backend.app.main import app
+from backend.app.models.schemas import SortableColumn, SortOrder
+from backend.app.services.analytics_service import AnalyticsService
 
 client = TestClient(app)
 
@@ -45,6 +47,31 @@ def test_search_players_case_insensitive():
     assert all("brown" in p["name"].lower() for p in payload["players"])
 
 
+def test_search_term_is_bound_not_interpolated():
+    """Quotes and LIKE wildcards in the search term are matched literally.
+
+    Calls the DuckDB implementation directly: requests run on Polars unless
+    startup calibration picked DuckDB, so the endpoint may never reach the SQL.
+    """
+    args = (10, 0, SortableColumn.AVG_PICK, SortOrder.ASC)
+
+    players, total = AnalyticsService._duckdb_players(None, "ja'marr", *args)
+    assert [p["name"] for p in players] == ["Ja'Marr Chase"]
+    assert total == 1
+
+    for wildcard in ("%", "_"):
+        players, total = AnalyticsService._duckdb_players(None, wildcard, *args)
+        assert players == []
+        assert total == 0
+
+
+def test_sort_by_name():
+    resp = client.get("/api/players/", params={"sort_by": "name", "limit": 20})
+    assert resp.status_code == 200
+    names = [p["name"] for p in resp.json()["players"]]
+    assert names == sorted(names)
+
+
 def test_filter_by_position():
     """Filtering by a single position returns only that position."""
     resp = client.get("/api/players/", params={"positions": "WR", "limit": 30})
@@ -71,6 +98,8 @@ def test_combinations_endpoint_basic():
     assert resp.status_code == 200
     payload = resp.json()
     assert "combinations" in payload
+    # The total reflects every matching team, not just the returned page
+    assert payload["total_combinations"] >= len(payload["combinations"])
 
 
 def test_roster_construction_endpoint():
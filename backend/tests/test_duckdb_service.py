@@ -1,6 +1,7 @@
 """Unit tests for the DuckDBService wrapper."""
 
 import polars as pl
+import pytest
 
 from backend.app.services.duckdb_service import duckdb_service
 
@@ -13,6 +14,12 @@ def test_simple_select():
     assert df["one"].to_list() == [1]
 
 
+def test_query_scalar():
+    """query_scalar returns the bare value of a one-cell result."""
+    assert duckdb_service.query_scalar("SELECT ? + 1", [41]) == 42
+    assert duckdb_service.query_scalar("SELECT 1 WHERE false") is None
+
+
 def test_picks_view_query():
     """The `picks` view should contain rows and expected columns."""
     df: pl.DataFrame = duckdb_service.query("SELECT COUNT(*) AS cnt FROM picks")
@@ -24,3 +31,20 @@ def test_picks_view_query():
     expected_cols = {"player", "Position", "pick", "draft"}
     actual_cols = set(columns_df["name"].to_list())
     assert expected_cols.issubset(actual_cols)
+
+
+@pytest.mark.parametrize("anchor_player", [
+    "Christian McCaffrey",
+    "Travis Kelce",
+])
+def test_picks_view_pushdown(anchor_player):
+    """The player predicate and the column projection reach the parquet scan."""
+    plan = duckdb_service.query(
+        "EXPLAIN SELECT COUNT(*) FROM picks WHERE player = ?", [anchor_player]
+    )["explain_value"][0]
+    scan = plan[plan.index("PARQUET_SCAN"):]
+    # Filter pushdown: the predicate is evaluated inside the scan
+    assert "Filters:" in scan
+    assert "player=" in scan
+    # Projection pushdown: a bare count reads no columns beyond the filter
+    assert "Projections:" not in scan
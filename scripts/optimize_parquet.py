@@ -0,0 +1,50 @@
+"""Rewrite the draft parquet file so readers can prune row groups.
+
+Every analytics query filters on ``round``.  Writing the file sorted by
+``round`` with small row groups gives each row group a tight min/max range,
+so DuckDB's ``parquet_scan`` and Polars' ``scan_parquet`` can skip whole row
+groups for ``round <= n`` predicates instead of decoding the full file.
+
+Usage::
+
+    python scripts/optimize_parquet.py [path/to/file.parquet]
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import polars as pl
+
+DEFAULT_PATH = Path(__file__).resolve().parents[1] / "data" / "updated_bestball_data.parquet"
+
+SORT_COLUMNS = ["round", "team_id"]
+ROW_GROUP_SIZE = 65_536
+# Pinned so the output does not drift with the writer's default.  Level 9
+# and 128k-row groups saved only 2-3% on disk and did not change DuckDB
+# query times, so the cheaper-to-write settings are kept.
+COMPRESSION_LEVEL = 3
+
+
+def optimize(path: Path) -> None:
+    """Sort the file by ``SORT_COLUMNS`` and rewrite it with small row groups."""
+    # Plain strings let the writer pick its own per-row-group dictionaries,
+    # which compress far better than re-emitting the in-memory categoricals.
+    df = (
+        pl.read_parquet(path)
+        .with_columns(pl.col(pl.Categorical).cast(pl.String))
+        .sort(SORT_COLUMNS)
+    )
+    df.write_parquet(
+        path,
+        compression="zstd",
+        compression_level=COMPRESSION_LEVEL,
+        statistics=True,
+        row_group_size=ROW_GROUP_SIZE,
+    )
+    print(f"Rewrote {path} ({df.height} rows, sorted by {', '.join(SORT_COLUMNS)})")
+
+
+if __name__ == "__main__":
+    optimize(Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PATH)